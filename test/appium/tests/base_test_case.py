@@ -1,10 +1,14 @@
 import pytest
 import sys
-import re
+import time
+import random
 import subprocess
 import asyncio
+import functools
 
 from os import environ
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from appium import webdriver
 from abc import ABCMeta, abstractmethod
 from selenium.common.exceptions import WebDriverException
@@ -12,6 +16,58 @@ from tests import test_suite_data, start_threads
 from views.base_view import BaseView
 
 
+@functools.lru_cache(maxsize=1)
+def _list_adb_devices():
+    raw_out = subprocess.check_output(['adb', 'devices']).decode().splitlines()
+    return tuple(line.split('\t', 1)[0] for line in raw_out[1:] if line.rstrip().endswith('\tdevice'))
+
+
+def create_remote_driver(executor, capabilities):
+    return webdriver.Remote(executor, capabilities)
+
+
+class DriverPool(object):
+
+    idle = dict()
+
+    @classmethod
+    def acquire(cls, executor, capabilities):
+        key = (executor, frozenset(capabilities.items()))
+        while cls.idle.get(key):
+            driver = cls.idle[key].pop()
+            try:
+                driver.current_activity
+                return driver
+            except WebDriverException:
+                cls.quit(driver)
+        driver = create_remote_driver(executor, capabilities)
+        driver.pool_key = key
+        return driver
+
+    @classmethod
+    def release(cls, driver):
+        try:
+            driver.reset()
+        except WebDriverException:
+            driver.quit()
+            return
+        cls.idle.setdefault(driver.pool_key, list()).append(driver)
+
+    @staticmethod
+    def quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @classmethod
+    def quit_all(cls):
+        for drivers in cls.idle.values():
+            for driver in drivers:
+                cls.quit(driver)
+        cls.idle.clear()
+
+
 class AbstractTestCase:
 
     __metaclass__ = ABCMeta
@@ -38,23 +94,23 @@ class AbstractTestCase:
                                                          pytest.config.getoption('build')))
 
     def add_local_devices_to_capabilities(self):
+        if pytest.config.getoption('refresh_devices'):
+            _list_adb_devices.cache_clear()
         updated_capabilities = list()
-        raw_out = re.split(r'[\r\\n]+', str(subprocess.check_output(['adb', 'devices'])).rstrip())
-        for line in raw_out[1:]:
-            serial = re.findall(r"([\d.\d:]*\d+)", line)
-            if serial:
-                capabilities = self.capabilities_local
-                capabilities['udid'] = serial[0]
-                updated_capabilities.append(capabilities)
+        capabilities_local = self.capabilities_local
+        for serial in _list_adb_devices():
+            capabilities = dict(capabilities_local)
+            capabilities['udid'] = serial
+            updated_capabilities.append(capabilities)
         return updated_capabilities
 
-    @property
-    def capabilities_sauce_lab(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _capabilities_sauce_lab():
         desired_caps = dict()
         desired_caps['app'] = 'sauce-storage:' + test_suite_data.apk_name
 
         desired_caps['build'] = pytest.config.getoption('build')
-        desired_caps['name'] = test_suite_data.current_test.name
         desired_caps['platformName'] = 'Android'
         desired_caps['appiumVersion'] = '1.7.2'
         desired_caps['platformVersion'] = '7.1'
@@ -66,10 +122,17 @@ class AbstractTestCase:
         desired_caps['automationName'] = 'UiAutomator2'
         desired_caps['setWebContentDebuggingEnabled'] = True
         desired_caps['ignoreUnimportantViews'] = False
-        return desired_caps
+        return MappingProxyType(desired_caps)
 
     @property
-    def capabilities_local(self):
+    def capabilities_sauce_lab(self):
+        desired_caps = dict(self._capabilities_sauce_lab())
+        desired_caps['name'] = test_suite_data.current_test.name
+        return desired_caps
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _capabilities_local():
         desired_caps = dict()
         desired_caps['app'] = pytest.config.getoption('apk')
         desired_caps['deviceName'] = 'nexus_5'
@@ -81,7 +144,11 @@ class AbstractTestCase:
         desired_caps['unicodeKeyboard'] = True
         desired_caps['automationName'] = 'UiAutomator2'
         desired_caps['setWebContentDebuggingEnabled'] = True
-        return desired_caps
+        return MappingProxyType(desired_caps)
+
+    @property
+    def capabilities_local(self):
+        return dict(self._capabilities_local())
 
     @abstractmethod
     def setup_method(self, method):
@@ -95,15 +162,13 @@ class AbstractTestCase:
     def environment(self):
         return pytest.config.getoption('env')
 
-    @property
-    def implicitly_wait(self):
-        return 8
-
     errors = []
 
     def verify_no_errors(self):
         if self.errors:
-            pytest.fail('. '.join([self.errors.pop(0) for _ in range(len(self.errors))]))
+            msg = '. '.join(self.errors)
+            del self.errors[:]
+            pytest.fail(msg)
 
 
 class SingleDeviceTestCase(AbstractTestCase):
@@ -115,84 +180,110 @@ class SingleDeviceTestCase(AbstractTestCase):
                                   'capabilities': self.capabilities_sauce_lab}}
         counter = 0
         self.driver = None
-        while not self.driver and counter <= 3:
+        while not self.driver:
             try:
-                self.driver = webdriver.Remote(capabilities[self.environment]['executor'],
-                                               capabilities[self.environment]['capabilities'])
-                self.driver.implicitly_wait(self.implicitly_wait)
+                self.driver = DriverPool.acquire(capabilities[self.environment]['executor'],
+                                                 capabilities[self.environment]['capabilities'])
                 BaseView(self.driver).accept_agreements()
                 test_suite_data.current_test.jobs.append(self.driver.session_id)
                 break
             except WebDriverException:
+                if self.driver:
+                    break
+                if counter >= 2:
+                    raise
+                time.sleep(random.uniform(0.05, 0.25) * 2 ** counter)
                 counter += 1
 
     def teardown_method(self, method):
         if self.environment == 'sauce':
             self.print_sauce_lab_info(self.driver)
         try:
-            self.driver.quit()
+            if self.environment == 'local':
+                DriverPool.release(self.driver)
+            else:
+                self.driver.quit()
         except (WebDriverException, AttributeError):
             pass
 
 
-class LocalMultipleDeviceTestCase(AbstractTestCase):
+class BaseMultipleDeviceTestCase(AbstractTestCase):
+
+    def quit_drivers(self):
+        def quit_driver(driver):
+            try:
+                driver.quit()
+            except (WebDriverException, AttributeError):
+                pass
+
+        if self.drivers:
+            with ThreadPoolExecutor(max_workers=len(self.drivers)) as executor:
+                list(executor.map(quit_driver, self.drivers.values()))
+
+
+class LocalMultipleDeviceTestCase(BaseMultipleDeviceTestCase):
 
     def setup_method(self, method):
         self.drivers = dict()
 
     def create_drivers(self, quantity):
         capabilities = self.add_local_devices_to_capabilities()
+        if quantity > len(capabilities):
+            pytest.skip('%s devices required, %s attached' % (quantity, len(capabilities)))
+        DriverPool.quit_all()
+        loop = asyncio.new_event_loop()
+        try:
+            sessions = [loop.run_in_executor(None, create_remote_driver, self.executor_local, capabilities[driver])
+                        for driver in range(quantity)]
+            results = loop.run_until_complete(asyncio.gather(*sessions, return_exceptions=True))
+        finally:
+            loop.close()
+        errors = [result for result in results if isinstance(result, Exception)]
+        for driver, session in enumerate(results):
+            if not isinstance(session, Exception):
+                self.drivers[driver] = session
+        if errors:
+            raise errors[0]
         for driver in range(quantity):
-            self.drivers[driver] = webdriver.Remote(self.executor_local, capabilities[driver])
-            self.drivers[driver].implicitly_wait(self.implicitly_wait)
             BaseView(self.drivers[driver]).accept_agreements()
             test_suite_data.current_test.jobs.append(self.drivers[driver].session_id)
 
     def teardown_method(self, method):
-        for driver in self.drivers:
-            try:
-                self.drivers[driver].quit()
-            except WebDriverException:
-                pass
-
+        self.quit_drivers()
 
-class SauceMultipleDeviceTestCase(AbstractTestCase):
 
-    @classmethod
-    def setup_class(cls):
-        cls.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(cls.loop)
+class SauceMultipleDeviceTestCase(BaseMultipleDeviceTestCase):
 
     def setup_method(self, method):
         self.drivers = dict()
 
     def create_drivers(self, quantity=2):
-        self.drivers = self.loop.run_until_complete(start_threads(quantity, webdriver.Remote,
-                                                    self.drivers,
-                                                    self.executor_sauce_lab,
-                                                    self.capabilities_sauce_lab))
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self.drivers = loop.run_until_complete(start_threads(quantity, create_remote_driver,
+                                                   self.drivers,
+                                                   self.executor_sauce_lab,
+                                                   self.capabilities_sauce_lab))
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
         for driver in range(quantity):
-            self.drivers[driver].implicitly_wait(self.implicitly_wait)
             BaseView(self.drivers[driver]).accept_agreements()
             test_suite_data.current_test.jobs.append(self.drivers[driver].session_id)
 
     def teardown_method(self, method):
-        for driver in self.drivers:
+        for driver in self.drivers.values():
             try:
-                self.print_sauce_lab_info(self.drivers[driver])
-                self.drivers[driver].quit()
-            except (WebDriverException, AttributeError):
+                self.print_sauce_lab_info(driver)
+            except AttributeError:
                 pass
-
-    @classmethod
-    def teardown_class(cls):
-        cls.loop.close()
+        self.quit_drivers()
 
 
 environments = {'local': LocalMultipleDeviceTestCase,
                 'sauce': SauceMultipleDeviceTestCase}
 
 
-class MultipleDeviceTestCase(environments[pytest.config.getoption('env')]):
-
-    pass
+def make_multiple_device_testcase(env):
+    return type('MultipleDeviceTestCase', (environments[env],), dict())
@@ -51,6 +51,10 @@ def pytest_addoption(parser):
                      action='store',
                      default=None,
                      help='Pull Request number')
+    parser.addoption('--refresh_devices',
+                     action='store_true',
+                     default=False,
+                     help='Re-read attached adb devices for every test instead of once per session')
 
 
 def is_master(config):
@@ -68,6 +72,8 @@ def pytest_configure(config):
     if config.getoption('log'):
         import logging
         logging.basicConfig(level=logging.INFO)
+    from tests import base_test_case
+    base_test_case.MultipleDeviceTestCase = base_test_case.make_multiple_device_testcase(config.getoption('env'))
     test_suite_data.apk_name = ([i for i in [i for i in config.getoption('apk').split('/')
                                              if '.apk' in i]])[0]
     if is_master(config) and config.getoption('env') == 'sauce':
@@ -89,6 +95,11 @@ def pytest_configure(config):
                 sauce.storage.upload_file(config.getoption('apk'))
 
 
+def pytest_sessionfinish(session, exitstatus):
+    from tests.base_test_case import DriverPool
+    DriverPool.quit_all()
+
+
 def pytest_unconfigure(config):
     if is_master(config) and config.getoption('pr_number'):
         from github import Github
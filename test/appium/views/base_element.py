@@ -36,17 +36,23 @@ class BaseElement(object):
     def navigate(self):
         return None
 
+    def smart_find(self, condition, seconds=8):
+        return WebDriverWait(self.driver, seconds, poll_frequency=0.2)\
+            .until(condition((self.locator.by, self.locator.value)))
+
     def find_element(self):
         info('Looking for %s' % self.name)
         try:
-            return self.driver.find_element(self.locator.by, self.locator.value)
-        except NoSuchElementException as exception:
-            exception.msg = "'%s' is not found on screen, using: '%s'" % (self.name, self.locator)
-            raise exception
+            return self.smart_find(expected_conditions.presence_of_element_located)
+        except TimeoutException:
+            raise NoSuchElementException("'%s' is not found on screen, using: '%s'" % (self.name, self.locator))
 
     def find_elements(self):
         info('Looking for %s' % self.name)
-        return self.driver.find_elements(self.locator.by, self.locator.value)
+        try:
+            return self.smart_find(expected_conditions.presence_of_all_elements_located)
+        except TimeoutException:
+            return list()
 
     def wait_for_element(self, seconds=10):
         try:
@@ -182,10 +182,10 @@ class BaseView(object):
             'text': BaseText
         }
 
-    def accept_agreements(self):
+    def accept_agreements(self, seconds=15):
         for button in self.ok_button, self.continue_button:
             try:
-                button.wait_for_element(15)
+                button.wait_for_element(seconds)
                 button.click()
             except (NoSuchElementException, TimeoutException):
                 pass